@@ -15,7 +15,72 @@ import sys
 BORING_PLATFORMS = ['PocketPC', 'win32']
 
 
-class Color:
+def _stdout_isatty():
+    return hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
+
+
+_IS_TTY_STDOUT = _stdout_isatty()
+
+
+def _colors_enabled():
+    """ Return whether ANSI escape sequences should be emitted """
+    isatty = _IS_TTY_STDOUT
+    isplat = sys.platform not in BORING_PLATFORMS
+    isenv = os.getenv('ANSI_COLORS_DISABLED') is None
+    return isatty and isplat and isenv
+
+
+_COLORS_ENABLED = _colors_enabled()
+
+# Escape sequences keyed by code, filled in lazily by ``_esc()``
+_ESC_CACHE = {}
+
+
+def _esc(code):
+    """ Return (cached) escape sequence for given code """
+    s = _ESC_CACHE.get(code)
+    if s is not None:
+        return s
+    return _ESC_CACHE.setdefault(code, '\033[{}m'.format(code))
+
+
+def refresh():
+    """ Re-evaluate whether colors are enabled
+
+    This is only needed if STDOUT or ``ANSI_COLORS_DISABLED`` environment
+    variable changes after the module is imported.
+    """
+    global _IS_TTY_STDOUT, _COLORS_ENABLED
+    _IS_TTY_STDOUT = _stdout_isatty()
+    _COLORS_ENABLED = _colors_enabled()
+    color.enabled = _COLORS_ENABLED
+
+
+_RESET_ESC = _esc(0)
+
+
+def _combine_codes(colors, styles, backgrounds):
+    """ Return codes for all foreground, style and background combinations
+
+    The return value is a dict keyed by ``(color, style, bg)`` tuples where
+    style and background may be ``None``.
+    """
+    fg_style = {}
+    for name, fg in colors.items():
+        fg_style[(name, None)] = fg
+        for style, code in styles.items():
+            fg_style[(name, style)] = fg + ';' + code
+    codes = {}
+    for (name, style), fg in fg_style.items():
+        codes[(name, style, None)] = (fg,)
+        for bg, code in backgrounds.items():
+            codes[(name, style, bg)] = (fg, code)
+    return codes
+
+
+class Color(object):
+    __slots__ = ('enabled',)
+
     COLORS = {
         'default': '0',
         'black': '30',
@@ -50,30 +115,27 @@ class Color:
 
     RESET = 0
 
-    def __init__(self):
-        isatty = hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
-        isplat = sys.platform not in BORING_PLATFORMS
-        isenv = os.getenv('ANSI_COLORS_DISABLED') is None
-        self.enabled = isatty and isplat and isenv
+    # Escape prefixes for every (color, style, bg) combination
+    PREFIXES = dict(
+        (key, ''.join(_esc(c) for c in codes))
+        for key, codes in _combine_codes(COLORS, STYLES, BACKGROUNDS).items())
 
-    def _esc(self, code):
-        if not self.enabled:
-            return ''
-        return '\033[{}m'.format(code)
+    def __init__(self):
+        self.enabled = _COLORS_ENABLED
 
     def _wrap(self, s, codes=[RESET]):
-        codes = ''.join(self._esc(c) for c in codes)
-        return '{}{}{}'.format(codes, s, self._esc(self.RESET))
+        # Always return text, regardless of what was passed in
+        s = '%s' % (s,)
+        if not self.enabled:
+            return s
+        return ''.join(_esc(c) for c in codes) + s + _RESET_ESC
 
     def color(self, s, color='default', style=None, bg=None):
-        codes = []
-        fg = self.COLORS[color]
-        if style:
-            fg += ';' + self.STYLES[style]
-        codes.append(fg)
-        if bg:
-            codes.append(self.BACKGROUNDS[bg])
-        return self._wrap(s, codes)
+        s = '%s' % (s,)
+        if not self.enabled:
+            return s
+        prefix = self.PREFIXES[(color, style or None, bg or None)]
+        return prefix + s + _RESET_ESC
 
     def black(self, s, style=None, bg=None):
         return self.color(s, 'black', style, bg)
@@ -11,6 +11,7 @@ file that comes with the source code, or http://www.gnu.org/licenses/gpl.txt.
 from __future__ import print_function
 
 import sys
+import locale
 import signal
 import traceback
 import contextlib
@@ -25,7 +26,7 @@ except NameError:
     read = input
 
 
-class Console:
+class Console(object):
     """
     Wrapper around print with helper methods that cover typical ``print()``
     usage in console programs.
@@ -38,7 +39,7 @@ class Console:
     color = ansi_colors.color
 
     def __init__(self, verbose=False, stdout=sys.stdout, stderr=sys.stderr,
-                 debug=False):
+                 debug=False, register_signals=True):
         """
         ``verbose`` flag controls suppression of verbose outputs (those printed
         using ``pverb()`` method). The verbose output is usually a helpful
@@ -50,11 +51,23 @@ class Console:
 
         To enable debugging (e.g., printing stack traces), use the ``debug``
         argument and set it to ``True``.
+
+        Signal handlers are registered using ``register_signals()`` method
+        unless ``register_signals`` argument is set to ``False``.
         """
         self.verbose = verbose
         self.out = stdout
         self.err = stderr
-        self.register_signals()
+        # Output is only flushed after each write when attached to terminal.
+        # ``print()`` writes to STDOUT when file is ``None``, so check that.
+        out = self._stream(stdout, sys.stdout)
+        err = self._stream(stderr, sys.stderr)
+        self._out_isatty = hasattr(out, 'isatty') and out.isatty()
+        self._err_isatty = hasattr(err, 'isatty') and err.isatty()
+        self._interm = hasattr(sys.stdin, 'isatty') and sys.stdin.isatty()
+        self._outterm = hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
+        if register_signals:
+            self.register_signals()
         self.debug = debug
 
     def print(self, *args, **kwargs):
@@ -65,16 +78,38 @@ class Console:
         print(*args, **kwargs)
 
     def pstd(self, *args, **kwargs):
-        """ Console to STDOUT """
+        """ Console to STDOUT
+
+        Output is flushed if STDOUT is a terminal or ``flush`` keyword argument
+        is set to ``True``.
+        """
+        flush = kwargs.pop('flush', False)
         kwargs['file'] = self.out
         self.print(*args, **kwargs)
-        sys.stdout.flush()
+        if flush or self._out_isatty:
+            self._stream(self.out, sys.stdout).flush()
 
     def perr(self, *args, **kwargs):
-        """ Console to STERR """
+        """ Console to STERR
+
+        Output is flushed if STDERR is a terminal or ``flush`` keyword argument
+        is set to ``True``.
+        """
+        flush = kwargs.pop('flush', False)
         kwargs['file'] = self.err
         self.print(*args, **kwargs)
-        sys.stderr.flush()
+        if flush or self._err_isatty:
+            self._stream(self.err, sys.stderr).flush()
+
+    def flush(self):
+        """ Flush both STDOUT and STDERR """
+        self._stream(self.out, sys.stdout).flush()
+        self._stream(self.err, sys.stderr).flush()
+
+    @staticmethod
+    def _stream(f, default):
+        """ Return file ``f``, or ``default`` if ``f`` is ``None`` """
+        return default if f is None else f
 
     def pok(self, val, ok='OK'):
         """ Print val: OK in green on STDOUT """
@@ -90,7 +125,7 @@ class Console:
 
     def pverr(self, val, msg, *args, **kwargs):
         kwargs.setdefault('file', self.err)
-        self.print('{}: {}'.format(val, msg), *args, **kwargs)
+        self.print('%s: %s' % (val, msg), *args, **kwargs)
 
     def pverb(self, *args, **kwargs):
         """ Console verbose message to STDOUT """
@@ -138,15 +173,17 @@ class Console:
         """
         if intro:
             self.pstd(utils.rewrap_long(intro))
-        val = self.read(prompt, clean)
+        if callable(error):
+            error_fn = error
+        else:
+            error_fn = lambda v: error
+        readval = self.read
+        val = readval(prompt, clean)
         while not validator(val):
             if not strict:
                 return default
-            if hasattr(error, '__call__'):
-                self.perr(error(val))
-            else:
-                self.perr(error)
-            val = self.read(prompt, clean)
+            self.perr(error_fn(val))
+            val = readval(prompt, clean)
         return val
 
     def yesno(self, prompt, error='Please type either y or n', intro=None,
@@ -222,55 +259,97 @@ class Console:
         used to define what value is returned in case user select an invalid
         value when strict checking is off.
         """
-        numbers = list(numerator(len(choices)))
-        labels = (label for _, label in choices)
-        values = [value for value, _ in choices]
-        # Print intro and menu itself
+        # Single pass over choices, so that any iterable (incl. generators)
+        # can be used
+        values, labels = list(zip(*choices)) or ((), ())
+        numbers = list(numerator(len(values)))
+        number_to_value = dict(zip(numbers, values))
+        # Print intro and menu itself in a single write
+        lines = [formatter(n, label) for n, label in zip(numbers, labels)]
         if intro:
-            self.pstd('\n' + utils.rewrap_long(intro))
-        for n, label in zip(numbers, labels):
-            self.pstd(formatter(n, label))
+            lines.insert(0, '\n' + utils.rewrap_long(intro))
+        if lines:
+            self.pstd('\n'.join(lines))
         # Define the validator
-        validator = lambda x: x in numbers
+        validator = set(numbers).__contains__
         val = self.rvpl(prompt, error=error, validator=validator, clean=clean,
                         strict=strict, default=default)
         if not strict and val == default:
             return val
-        return values[numbers.index(val)]
+        return number_to_value[val]
 
-    def readpipe(self, chunk=None):
+    def readpipe(self, chunk=None, binary=False):
         """ Return iterator that iterates over STDIN line by line
 
         If ``chunk`` is set to a positive non-zero integer value, then the
         reads are performed in chunks of that many lines, and returned as a
         list. Otherwise the lines are returned one by one.
+
+        If ``binary`` flag is set, lines are returned as undecoded bytes read
+        directly from the underlying binary buffer, and line-feed characters
+        are not translated. Since text reads from STDIN (e.g., ``read()``)
+        may leave data buffered in the text layer, mixing earlier text reads
+        with binary reads is not supported.
         """
+        if binary:
+            lines = self._readbinary()
+        else:
+            # Text STDIN is buffered, so this is not one read per line
+            lines = iter(sys.stdin.readline, '')
         read = []
-        while True:
-            l = sys.stdin.readline()
-            if not l:
-                if read:
-                    yield read
-                    return
-                return
+        for l in lines:
             if not chunk:
                 yield l
             else:
                 read.append(l)
                 if len(read) == chunk:
                     yield read
+                    read = []
+        if read:
+            yield read
+
+    def _readbinary(self):
+        """ Return iterator over lines read from STDIN as bytes
+
+        Lines are read from the underlying binary buffer without decoding.
+        STDIN objects without a binary buffer (e.g., ``io.StringIO``) are read
+        as text and each line is encoded using their encoding.
+        """
+        stdin = sys.stdin
+        buf = getattr(stdin, 'buffer', None)
+        if buf is not None:
+            return iter(buf.readline, b'')
+        encoding = (getattr(stdin, 'encoding', None) or
+                    locale.getpreferredencoding())
+        errors = getattr(stdin, 'errors', None) or 'strict'
+        return (l if isinstance(l, bytes) else l.encode(encoding, errors)
+                for l in iter(stdin.readline, ''))
 
     @property
     def interm(self):
-        return hasattr(sys.stdin, 'isatty') and sys.stdin.isatty()
+        return self._interm
 
     @property
     def outterm(self):
-        return hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
+        return self._outterm
 
     def register_signals(self):
-        signal.signal(signal.SIGINT, self.onint)
-        signal.signal(signal.SIGPIPE, self.onpipe)
+        """ Register SIGINT and SIGPIPE handlers
+
+        Handlers that are already registered are not registered again. Signal
+        handlers can only be set in the main thread, so nothing is registered
+        when this method is called from any other thread.
+        """
+        handlers = ((signal.SIGINT, self.onint),
+                    (signal.SIGPIPE, self.onpipe))
+        for signum, handler in handlers:
+            if signal.getsignal(signum) == handler:
+                continue
+            try:
+                signal.signal(signum, handler)
+            except ValueError:
+                # Not in main thread
+                return
 
     def onint(self, signum, exc):
         self.perr('\nQuitting program due to keyboard interrupt')
@@ -345,13 +424,16 @@ class Console:
         """
         if not onerror:
             onerror = self.error()
-        if type(onerror) is str:
+        elif isinstance(onerror, str):
             onerror = self.error(msg=onerror)
         self.pverb(msg, end=sep)
-        prog = progress.Progress(self.pverb, end=end, abrt=abrt, prog=prog)
+        # Progress indicators are buffered unless the user is watching
+        threshold = 1 if self._out_isatty else progress.PROG_THRESHOLD
+        prog = progress.Progress(self.pverb, end=end, abrt=abrt, prog=prog,
+                                 threshold=threshold)
         try:
             yield prog
-            prog.end()
+            prog.end_default()
         except self.ProgressOK:
             pass
         except self.ProgressAbrt as err:
@@ -367,3 +449,6 @@ class Console:
                 traceback.print_exc()
             if reraise:
                 raise self.ProgressAbrt()
+        finally:
+            # Do not lose buffered indicators when exiting without a banner
+            prog._flush_prog()
@@ -10,6 +10,9 @@ file that comes with the source code, or http://www.gnu.org/licenses/gpl.txt.
 
 from . import ansi_colors
 
+# Default number of buffered progress indicator characters
+PROG_THRESHOLD = 32
+
 
 class ProgressEnd(Exception):
     pass
@@ -23,14 +26,18 @@ class ProgressAbrt(ProgressEnd):
     pass
 
 
-class Progress:
+class Progress(object):
     """
     Wrapper that manages step progress
     """
 
+    __slots__ = ('printer', 'end_msg', 'prog_msg', 'abrt_msg', '_end_colored',
+                 '_abrt_colored', '_prog_buf', '_prog_len', '_prog_threshold')
+
     color = ansi_colors.color
 
-    def __init__(self, printer, end='DONE', abrt='FAIL', prog='.'):
+    def __init__(self, printer, end='DONE', abrt='FAIL', prog='.',
+                 threshold=PROG_THRESHOLD):
         """
         The ``Console`` method to be used is specified using the ``printer``
         argument.
@@ -43,6 +50,10 @@ class Progress:
         The ``prog`` argument specifies the character to be used as progress
         indicator. It defaults to '.'.
 
+        Progress indicators are buffered and printed once ``threshold``
+        characters have accumulated, or when ``end()`` or ``abrt()`` is called.
+        Setting ``threshold`` to 1 prints each indicator immediately.
+
         The methods in this class all print using printer's ``pverb()`` method.
         This can be changed by specifying a different method using the
         ``mthod`` argument.
@@ -51,6 +62,27 @@ class Progress:
         self.end_msg = end
         self.prog_msg = prog
         self.abrt_msg = abrt
+        self._end_colored = self.color.green(end)
+        self._abrt_colored = self.color.red(abrt)
+        self._prog_buf = []
+        self._prog_len = 0
+        self._prog_threshold = threshold
+
+    def _flush_prog(self):
+        """ Print any buffered progress indicators """
+        if self._prog_buf:
+            self.printer(''.join(self._prog_buf), end='')
+            self._prog_buf = []
+            self._prog_len = 0
+
+    def end_default(self):
+        """ Prints the default end banner and raises ``ProgressOK`` exception
+
+        This is a shortcut for calling ``end()`` with no arguments.
+        """
+        self._flush_prog()
+        self.printer(self._end_colored)
+        raise ProgressOK()
 
     def end(self, s=None, post=None, noraise=False):
         """ Prints the end banner and raises ``ProgressOK`` exception
@@ -62,14 +94,25 @@ class Progress:
         the close banner is printed, but before exceptions are raised. The
         ``post`` function takes no arguments.
         """
-        s = s or self.end_msg
-        self.printer(self.color.green(s))
+        if not (s or post or noraise):
+            return self.end_default()
+        self._flush_prog()
+        self.printer(self.color.green(s) if s else self._end_colored)
         if post:
             post()
         if noraise:
             return
         raise ProgressOK()
 
+    def abrt_default(self):
+        """ Prints the default abrt banner and raises ``ProgressAbrt``
+
+        This is a shortcut for calling ``abrt()`` with no arguments.
+        """
+        self._flush_prog()
+        self.printer(self._abrt_colored)
+        raise ProgressAbrt()
+
     def abrt(self, s=None, post=None, noraise=False):
         """ Prints the abrt banner and raises ``ProgressAbrt`` exception
 
@@ -80,8 +123,10 @@ class Progress:
         the close banner is printed, but before exceptions are raised. The
         ``post`` function takes no arguments.
         """
-        s = s or self.abrt_msg
-        self.printer(self.color.red(s))
+        if not (s or post or noraise):
+            return self.abrt_default()
+        self._flush_prog()
+        self.printer(self.color.red(s) if s else self._abrt_colored)
         if post:
             post()
         if noraise:
@@ -91,6 +136,7 @@ class Progress:
     def prog(self, s=None):
         """ Prints the progress indicator """
         s = s or self.prog_msg
-        self.printer(s, end='')
-
-
+        self._prog_buf.append(s)
+        self._prog_len += len(s)
+        if self._prog_len >= self._prog_threshold:
+            self._flush_prog()
@@ -9,14 +9,18 @@ file that comes with the source code, or http://www.gnu.org/licenses/gpl.txt.
 """
 
 import os
+import re
 import textwrap
 
 COLS = os.getenv('COLUMNS', 79)
 
+# Line feed along with any non-LF whitespace surrounding it
+LINE_BREAK = re.compile(r'[^\S\n]*\n[^\S\n]*')
+
 
 def rewrap(s, width=COLS):
     """ Join all lines from input string and wrap it at specified width """
-    s = ' '.join([l.strip() for l in s.strip().split('\n')])
+    s = LINE_BREAK.sub(' ', s.strip())
     return '\n'.join(textwrap.wrap(s, width))
 
 
@@ -28,7 +32,7 @@ def rewrap_long(s, width=COLS):
 
 def striplines(s):
     """ Strip whitespace from each line of input string """
-    return '\n'.join([l.strip() for l in s.strip().split('\n')])
+    return LINE_BREAK.sub('\n', s.strip())
 
 
 def safeint(s):